@@ -1,9 +1,11 @@
-from typing import List, Optional, TextIO, Callable
+from dataclasses import dataclass, field
+from typing import List, Optional, TextIO, Callable, Tuple
 
 import scopes
 import domains
 import library
 import sshd
+import tools
 from loggers import get_logger
 from model import *
 from scopes.ownership import set_owner
@@ -60,6 +62,26 @@ class InitializeWorld:
             return [e.key for w, e in created]
 
 
+@dataclass
+class WarmPlayer:
+    """
+    Kept for the lifetime of a connection so that each line doesn't
+    have to look the player up again. We remember the keys of the
+    player, their area and the entities that contributed to their last
+    command and fetch them all in one query before the next one, parsed
+    documents are reused if their version hasn't changed.
+    """
+
+    key: Optional[str] = None
+    keys: List[str] = field(default_factory=list)
+
+    def remember(self, world: World, player: Entity):
+        self.key = player.key
+        self.keys = [WorldKey] + [
+            e.key for e in tools.get_contributing_entities(world, player).all()
+        ]
+
+
 class Interactive(sshd.CommandHandler):
     def __init__(
         self,
@@ -78,6 +100,7 @@ class Interactive(sshd.CommandHandler):
             self.username, self.write
         )
         self.initialize = InitializeWorld(self.domain)
+        self.warm = WarmPlayer()
 
     async def write(self, item: Renderable, **kwargs):
         self.channel.write("\n" + str(item.render_tree()) + "\n\n")
@@ -85,20 +108,41 @@ class Interactive(sshd.CommandHandler):
     async def handle(self, line: str):
         log.info("handle: %s '%s'", self.username, line)
 
-        with self.domain.session() as session:
-            world, player = await self.initialize.create_player_if_necessary(
-                session, self.username, None
-            )
+        async def evaluate(session: domains.Session):
+            world, player = await self._get_player(session)
             reply = await session.execute(player, line.strip())
 
-            log.debug("reply: %s", reply)
+            await session.save()
 
-            if isinstance(reply, Renderable):
-                await self.write(reply)
-            else:
-                await self.write(String(str(reply)))
+            self.warm.remember(world, player)
 
-            await session.save()
+            return reply
+
+        # Replies are written after saving so that commands that
+        # conflict and are retried only reply once.
+        if self.warm.key:
+            reply = await self.domain.command(self.warm.key, evaluate)
+        else:
+            reply = await self.domain.retrying(evaluate)
+
+        log.debug("reply: %s", reply)
+
+        if isinstance(reply, Renderable):
+            await self.write(reply)
+        else:
+            await self.write(String(str(reply)))
+
+    async def _get_player(self, session: domains.Session) -> Tuple[World, Entity]:
+        if self.warm.key:
+            await session.warm(self.warm.keys)
+            world = await session.prepare()
+            player = await session.try_materialize_key(self.warm.key)
+            if player:
+                return world, player
+
+        return await self.initialize.create_player_if_necessary(
+            session, self.username, None
+        )
 
     async def finished(self):
         self.subscription.remove()
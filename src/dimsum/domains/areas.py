@@ -0,0 +1,97 @@
+import asyncio
+import contextlib
+import dataclasses
+from typing import AsyncIterator, Dict, List, Optional
+
+from loggers import get_logger
+from model import Entity
+
+import tools
+
+log = get_logger("dimsum.domains.areas")
+
+
+class AreaChangedException(Exception):
+    def __init__(self, keys: List[str]):
+        super().__init__("area changed: {0}".format(keys))
+        self.keys = keys
+
+
+@dataclasses.dataclass
+class HeldAreas:
+    person_key: str
+    keys: List[str] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class AreaLocks:
+    """
+    Serializes commands by the area the person is in, commands in the
+    same area run in the order they arrived and commands in different
+    areas run concurrently.
+
+    Locks are always waited on in key order, so two commands can never
+    wait on each other. The area is only known for sure once the person
+    has been materialized, so before saving we verify the areas we hold,
+    and take any extra area we need, a person who moved or whose area we
+    guessed wrong, only if that's possible without waiting. Otherwise
+    the command is abandoned and run again holding every area it needs.
+    """
+
+    locks: Dict[str, asyncio.Lock] = dataclasses.field(default_factory=dict)
+    users: Dict[str, int] = dataclasses.field(default_factory=dict)
+    areas: Dict[str, List[str]] = dataclasses.field(default_factory=dict)
+
+    def guess(self, person_key: str) -> List[str]:
+        return self.areas.get(person_key, [])
+
+    @contextlib.asynccontextmanager
+    async def hold(self, person_key: str) -> AsyncIterator[HeldAreas]:
+        held = HeldAreas(person_key)
+        try:
+            for key in sorted(set(self.guess(person_key))):
+                await self._acquire(key)
+                held.keys.append(key)
+            yield held
+        finally:
+            for key in reversed(held.keys):
+                self._release(key)
+
+    async def verify(self, held: HeldAreas, person: Optional[Entity]):
+        if person is None:
+            return
+
+        area = tools.area_of(person)
+        if area is None or area.key in held.keys:
+            self.areas[held.person_key] = [area.key] if area else []
+            return
+
+        if self.users.get(area.key, 0) > 0:
+            # Somebody else has this area and we can't wait while
+            # holding ours, try again holding both.
+            self.areas[held.person_key] = held.keys + [area.key]
+            raise AreaChangedException(self.areas[held.person_key])
+
+        # Nobody is using or waiting on this area, so this won't wait.
+        await self._acquire(area.key)
+        held.keys.append(area.key)
+        self.areas[held.person_key] = [area.key]
+
+    async def _acquire(self, key: str):
+        self.users[key] = self.users.get(key, 0) + 1
+        lock = self.locks.setdefault(key, asyncio.Lock())
+        try:
+            await lock.acquire()
+        except:
+            self._forget(key)
+            raise
+
+    def _release(self, key: str):
+        self.locks[key].release()
+        self._forget(key)
+
+    def _forget(self, key: str):
+        self.users[key] -= 1
+        if self.users[key] == 0:
+            del self.users[key]
+            del self.locks[key]
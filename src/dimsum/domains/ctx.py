@@ -195,6 +195,9 @@ class WorldCtx(Ctx):
     async def try_materialize_key(self, key: str) -> Optional[Entity]:
         return await self.session.try_materialize_key(key)
 
+    async def preload(self, entities: Sequence[Entity], hops: int = 1):
+        await self.session.preload(entities, hops=hops)
+
 
 def _notify_log():
     return get_logger("dimsum.domain.notify")
@@ -1,35 +1,57 @@
+import asyncio
 import dataclasses
+import random
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Union, Tuple
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    Tuple,
+)
 
 from loggers import get_logger
-from model import Comms
-from storage import EntityStorage, SqliteStorage
+from model import Comms, Registrar
+from storage import EntityStorage, SqliteStorage, VersionConflictException
 from bus import SubscriptionManager
 
 import handlers
 import dynamic
 
 from .session import Session
+from .areas import AreaLocks, AreaChangedException
 from .ctx import WorldCtx
 
 log = get_logger("dimsum.domains")
 
+T = TypeVar("T")
+
 
 class Domain:
     def __init__(
         self,
         store: Optional[EntityStorage] = None,
         subscriptions: Optional[SubscriptionManager] = None,
+        lazy: bool = False,
         **kwargs,
     ):
         super().__init__()
+        self.lazy = lazy
         self.store = store if store else SqliteStorage(":memory:")
         self.subscriptions = subscriptions if subscriptions else SubscriptionManager()
         self.comms: Comms = self.subscriptions
         self.handlers = [handlers.create(self.subscriptions)]
+        self.areas = AreaLocks()
+        self.conflicts = 0
+        self.retries = 0
 
-    def session(self) -> Session:
+    def session(self, lazy: Optional[bool] = None, read_only: bool = False) -> Session:
         log.info("session:new")
 
         return Session(
@@ -37,8 +59,69 @@ class Domain:
             handlers=self.handlers,
             ctx_factory=self.create_ctx,
             calls_saver=self.create_calls_saver,
+            registrar=Registrar(read_only=read_only),
+            lazy=self.lazy if lazy is None else lazy,
+            read_only=read_only,
         )
 
+    async def retrying(
+        self,
+        fn: Callable[[Session], Awaitable[T]],
+        attempts: int = 5,
+        backoff: float = 0.01,
+    ) -> T:
+        """
+        Runs fn in a new session, which is expected to save, and if
+        saving fails because somebody else modified the same entities
+        discards the session and runs fn again against fresh state. We
+        back off with jitter between attempts so that colliding
+        commands spread out rather than colliding again.
+        """
+        attempt = 0
+        while True:
+            delay = 0.0
+            with self.session() as session:
+                try:
+                    return await fn(session)
+                except AreaChangedException as e:
+                    # We know which areas to hold now, no need to wait.
+                    log.info("area-changed: retrying %s", e.keys)
+                    attempt += 1
+                    if attempt == attempts:
+                        raise
+                except VersionConflictException:
+                    self.conflicts += 1
+                    attempt += 1
+                    if attempt == attempts:
+                        log.warning("conflict: giving up attempts=%d", attempt)
+                        raise
+                    delay = random.uniform(0, backoff * (2**attempt))
+
+            self.retries += 1
+            if delay > 0:
+                log.info("conflict: retrying attempt=%d delay=%f", attempt, delay)
+                await asyncio.sleep(delay)
+
+    async def command(
+        self, person_key: str, fn: Callable[[Session], Awaitable[T]], **kwargs
+    ) -> T:
+        """
+        Like retrying, though serialized with other commands in the
+        same area as the person, see AreaLocks.
+        """
+
+        async def locked(session: Session) -> T:
+            async with self.areas.hold(person_key) as held:
+
+                async def verify(session: Session):
+                    person = session.registrar.find_by_key(person_key)
+                    await self.areas.verify(held, person)
+
+                session.saving.append(verify)
+                return await fn(session)
+
+        return await self.retrying(locked, **kwargs)
+
     def create_ctx(self, **kwargs):
         return WorldCtx(**kwargs)
 
@@ -46,7 +129,7 @@ class Domain:
         return SaveDynamicCalls(self, session)
 
     async def reload(self):
-        return Domain(empty=True, store=self.store)
+        return Domain(empty=True, store=self.store, lazy=self.lazy)
 
     async def close(self):
         await self.store.close()
@@ -5,6 +5,7 @@ import pprint
 import contextvars
 from typing import (
     Any,
+    Awaitable,
     Callable,
     Dict,
     List,
@@ -37,7 +38,6 @@ from model import (
     WelcomeAreaKey,
     get_current_gid,
     set_current_gid,
-    generate_security_check_from_json_diff,
     SecurityContext,
     SecurityCheckException,
     Serialized,
@@ -88,11 +88,27 @@ class Session(MaterializeAndCreate):
     world: Optional[World] = None
     created: float = dataclasses.field(default_factory=lambda: time.time())
     failed: bool = False
+    lazy: bool = False
+    read_only: bool = False
+    documents: Dict[str, List[Serialized]] = dataclasses.field(
+        default_factory=dict, repr=False
+    )
+    saving: List[Callable[["Session"], Awaitable[None]]] = dataclasses.field(
+        default_factory=list, repr=False
+    )
 
     @functools.cached_property
     def bus(self):
         return EventBus(handlers=self.handlers or [])
 
+    @functools.cached_property
+    def references(self) -> Optional[serializing.LazyReferences]:
+        if self.lazy:
+            return serializing.LazyReferences(
+                self.registrar, proxy_factory=proxying.create
+            )
+        return None
+
     def rollback(self):
         self.failed = True
 
@@ -107,10 +123,16 @@ class Session(MaterializeAndCreate):
     ) -> List[str]:
         log.info("saving %s", self.store)
 
+        if self.read_only:
+            raise ReadOnlySessionException()
+
         # Make sure that we haven't been marked for failure by an
         # earlier exception or issue.
         assert not self.failed
 
+        for hook in self.saving:
+            await hook(self)
+
         # If we materialized the world, then make sure we update the
         # gid we're on.
         if self.world:
@@ -137,9 +159,8 @@ class Session(MaterializeAndCreate):
             assert c.saving
             if c.diff:
                 sec_log.debug("security(%s) %s", entity, c.key)
-                check = generate_security_check_from_json_diff(
-                    c.saving.compiled, c.diff
-                )
+                check = self.registrar.generate_security_check(key, c.diff)
+                assert check
                 sec_log.debug("%s diff=%s", key, c.diff)
                 sec_log.debug("%s acls=%s", key, check.acls)
                 if create_security_context:
@@ -208,6 +229,8 @@ class Session(MaterializeAndCreate):
             proxy_factory=proxying.create,
             refresh=refresh,
             migrate=migrate,
+            lazy=self.references,
+            cache=None if refresh else self.documents,
         )
 
         for updated_world in [e for e in materialized.all() if e.key == WorldKey]:
@@ -220,6 +243,20 @@ class Session(MaterializeAndCreate):
         materialized = await self.try_materialize(**kwargs)
         return materialized.one()
 
+    async def warm(self, keys: List[str]):
+        """
+        Fetches the documents for entities we expect to materialize in
+        a single bulk load, materializing them afterwards won't go back
+        to storage. Documents are loaded when this is called so this
+        should happen before anything else in the session.
+        """
+        for se in await self.store.load_by_keys(keys):
+            self.documents[se.key] = [se]
+
+    async def preload(self, entities: Sequence[Entity], hops: int = 1):
+        if self.references:
+            await self.references.preload(self.store, entities, hops=hops)
+
     async def prepare(self, reach=None):
         if self.world:
             return self.world
@@ -248,6 +285,8 @@ class Session(MaterializeAndCreate):
         assert self.world
         log.info("executing: '%s'", command)
 
+        await tools.preload_contributing_entities(self, self.world, person)
+
         with self.ctx(person=person) as ctx:
             contributing = tools.get_contributing_entities(self.world, person)
             async with dynamic.Behavior(self.calls_saver(self), contributing) as db:
@@ -277,6 +316,9 @@ class Session(MaterializeAndCreate):
 
         world = await self.prepare()
 
+        if person:
+            await tools.preload_contributing_entities(self, world, person)
+
         area = await find_entity_area_maybe(person) if person else None
 
         with self.ctx(person=person, **kwargs) as ctx:
@@ -298,6 +340,7 @@ class Session(MaterializeAndCreate):
         # Materialize from the target entity to ensure we have
         # enough in memory to carry out its behavior.
         entity = await self.materialize(key=key, refresh=True)
+        await self.preload([entity], hops=2)
         with entity.make(behavior.Behaviors) as behave:
             if behave.get_default():
                 log.info("notifying: %s", entity)
@@ -396,6 +439,10 @@ class Session(MaterializeAndCreate):
 
 
 @dataclasses.dataclass
+class ReadOnlySessionException(Exception):
+    pass
+
+
 class DiffSecurityException(Exception):
     entity: Entity
     diff: Dict[str, Any]
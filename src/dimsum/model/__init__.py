@@ -18,7 +18,10 @@ from model.permissions import (
     Permission,
     SecurityMappings,
     generate_security_check_from_json_diff,
+    generate_security_check_from_changes,
+    generate_security_check_from_trie,
     find_all_acls,
+    AclTrie,
     SecurityContext,
     SecurityCheckException,
 )
@@ -28,6 +31,7 @@ from model.properties import (
     Map,
 )
 from model.conditions import Condition, AlwaysTrue
+from model.diffing import diff_compiled
 from model.properties import (
     Worn,
     Eaten,
@@ -197,9 +201,13 @@ __all__: List[str] = [
     "Permission",
     "SecurityContext",
     "generate_security_check_from_json_diff",
+    "generate_security_check_from_changes",
+    "generate_security_check_from_trie",
+    "AclTrie",
     "find_all_acls",
     "SecurityMappings",
     "CompiledJson",
+    "diff_compiled",
     "get_current_gid",
     "set_current_gid",
     "MissingEntityException",
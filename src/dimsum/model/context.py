@@ -1,6 +1,6 @@
 import abc
 import contextvars
-from typing import Any, Optional, List, Literal
+from typing import Any, Optional, List, Literal, Sequence
 
 from loggers import get_logger
 
@@ -29,6 +29,13 @@ class MaterializeAndCreate:
         assert e
         return e
 
+    async def preload(self, entities: Sequence[Entity], hops: int = 1):
+        """
+        Hint that the references held by the given entities are about
+        to be dereferenced, so they can be loaded in bulk.
+        """
+        pass
+
 
 class Ctx(MaterializeAndCreate):
     @property
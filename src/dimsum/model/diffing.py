@@ -0,0 +1,96 @@
+from typing import Any, Dict, List
+
+PyObjectKey = "py/object"
+
+
+def diff_compiled(original: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compares two compiled entity documents and returns the dotted
+    paths of the nodes that changed, mapped to their new values. The
+    paths are in the same form the security check matches against
+    Acls, so no intermediate diff document is ever built.
+
+    Identical subtrees, which is nearly all of them for a typical
+    save, are short-circuited by identity or native equality before
+    any walking happens, so an edit to one field of one scope costs
+    the size of that scope rather than the size of the document.
+    """
+    changes: Dict[str, Any] = {}
+    _diff_value(original, update, [], changes)
+    return changes
+
+
+def _join(path: List[str]) -> str:
+    return ".".join(path)
+
+
+def _diff_value(before: Any, after: Any, path: List[str], changes: Dict[str, Any]):
+    if before is after:
+        return
+    if type(before) is not type(after):
+        changes[_join(path)] = after
+        return
+    if isinstance(after, dict):
+        _diff_dict(before, after, path, changes)
+        return
+    if isinstance(after, list):
+        _diff_list(before, after, path, changes)
+        return
+    if before != after:
+        changes[_join(path)] = after
+
+
+def _diff_dict(
+    before: Dict[str, Any],
+    after: Dict[str, Any],
+    path: List[str],
+    changes: Dict[str, Any],
+):
+    # Changing the type of an object replaces it entirely.
+    if before.get(PyObjectKey) != after.get(PyObjectKey):
+        changes[_join(path)] = after
+        return
+
+    for key, value in after.items():
+        if key in before:
+            previous = before[key]
+            if previous is value or previous == value:
+                continue
+            _diff_value(previous, value, path + [key], changes)
+        else:
+            _inserted(value, path + [key], changes)
+
+    # Removing keys is a modification of the containing node.
+    for key in before.keys():
+        if key not in after:
+            changes[_join(path)] = after
+            return
+
+
+def _diff_list(
+    before: List[Any], after: List[Any], path: List[str], changes: Dict[str, Any]
+):
+    # Insertions and removals modify the list itself, otherwise we
+    # can compare the elements in place.
+    if len(before) != len(after):
+        changes[_join(path)] = after
+        return
+
+    for index, (previous, value) in enumerate(zip(before, after)):
+        if previous is value or previous == value:
+            continue
+        _diff_value(previous, value, path + [str(index)], changes)
+
+
+def _inserted(value: Any, path: List[str], changes: Dict[str, Any]):
+    # Newly added plain containers are walked so that every leaf is
+    # reported, objects are reported as a whole.
+    if isinstance(value, dict) and value and PyObjectKey not in value:
+        for key, child in value.items():
+            _inserted(child, path + [key], changes)
+        return
+    if isinstance(value, list) and value:
+        for index, child in enumerate(value):
+            _inserted(child, path + [str(index)], changes)
+        return
+    changes[_join(path)] = value
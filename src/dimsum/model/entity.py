@@ -2,7 +2,6 @@ import copy
 import dataclasses
 import json
 import time
-import jsondiff
 import shortuuid
 import functools
 import stringcase
@@ -24,7 +23,8 @@ from loggers import get_logger
 from .crypto import Identity, generate
 from .kinds import Kind
 from .properties import Common
-from .permissions import Acls
+from .permissions import Acls, AclTrie, SecurityCheck, generate_security_check_from_trie
+from .diffing import diff_compiled
 
 
 _key_fn: Callable = shortuuid.uuid
@@ -138,6 +138,7 @@ class CompiledJson:
 class Serialized:
     key: str
     serialized: str
+    version: Optional[int] = None
 
 
 @dataclasses.dataclass(frozen=True)
@@ -508,15 +509,17 @@ class RegistrationException(Exception):
 
 
 class Registrar:
-    def __init__(self, **kwargs):
+    def __init__(self, read_only: bool = False, **kwargs):
         super().__init__()
         self._log.debug("registrar:ctor")
+        self._read_only = read_only
         self._garbage: Dict[str, Entity] = {}
         self._entities: Dict[str, Entity] = {}
         self._originals: Dict[str, CompiledJson] = {}
         self._numbered: Dict[int, Entity] = {}
         self._key_to_number: Dict[str, int] = {}
         self._diffs: Dict[str, Dict[str, Any]] = {}
+        self._acls: Dict[str, AclTrie] = {}
         self._number: int = 0
 
     @functools.cached_property
@@ -539,13 +542,33 @@ class Registrar:
         return len(self._entities)
 
     # Called from the web.
-    def get_diff_if_available(self, key: str):
-        assert key in self._diffs[key]
-        return self._diffs[key]
+    def get_diff_if_available(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._diffs[key] if key in self._diffs else None
 
     def get_original_if_available(self, key: str) -> Optional[CompiledJson]:
         return self._originals[key] if key in self._originals else None
 
+    def get_acls(self, key: str) -> Optional[AclTrie]:
+        """
+        Returns the index of Acls in the original, registered JSON for
+        the given entity. This is built once per registered original.
+        """
+        if key in self._acls:
+            return self._acls[key]
+        if key in self._originals:
+            trie = AclTrie.build(self._originals[key].compiled)
+            self._acls[key] = trie
+            return trie
+        return None
+
+    def generate_security_check(
+        self, key: str, changes: Dict[str, Any]
+    ) -> Optional[SecurityCheck]:
+        trie = self.get_acls(key)
+        if trie:
+            return generate_security_check_from_trie(trie, changes)
+        return None
+
     def filter_modified(self, updating: Dict[str, CompiledJson]) -> Dict[str, Chimera]:
         return {
             key: Chimera(
@@ -565,12 +588,7 @@ class Registrar:
             if original.text == update.text:
                 return False
 
-            # TODO Parsing/diffing entity JSON
-            d = jsondiff.diff(
-                original.compiled,
-                update.compiled,
-                marshal=True,
-            )
+            d = diff_compiled(original.compiled, update.compiled)
             self._diffs[key] = d
 
             if key in self._entities:
@@ -595,7 +613,8 @@ class Registrar:
             return [self.register(e) for e in entity]
 
         assigned = entity.registered(self._number)
-        if compiled:
+        # Originals are only needed to find changes when saving.
+        if compiled and not self._read_only:
             if entity.key not in self._originals:
                 self._originals[entity.key] = compiled
         if assigned in self._numbered:
@@ -4,7 +4,7 @@ import copy
 import pprint
 import functools
 from itertools import groupby
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Iterable, Union
 
 from loggers import get_logger
 
@@ -173,6 +173,61 @@ def find_all_acls(original: Dict[str, Any]) -> Dict[str, Acls]:
     return _walk_original(original)
 
 
+@dataclasses.dataclass
+class AclTrie:
+    """
+    Index of the Acls in a compiled entity, keyed by path segment so
+    that the Acls governing a changed path can be found by walking
+    that path alone instead of the whole document.
+    """
+
+    acls: Optional[Acls] = None
+    children: Dict[str, "AclTrie"] = dataclasses.field(default_factory=dict)
+
+    @staticmethod
+    def build(original: Dict[str, Any]) -> "AclTrie":
+        root = AclTrie()
+
+        def walk(value, path: List[str]):
+            if isinstance(value, list):
+                for i, v in enumerate(value):
+                    walk(v, path + [str(i)])
+            elif isinstance(value, dict):
+                if AclsKey in value:
+                    root._insert(path).acls = Acls(**_prepare_acl(value[AclsKey]))
+                for key, child in value.items():
+                    walk(child, path + [key])
+
+        walk(original, [])
+        return root
+
+    def _insert(self, path: List[str]) -> "AclTrie":
+        node = self
+        for segment in path:
+            node = node.children.setdefault(segment, AclTrie())
+        return node
+
+    def matching(self, node: str) -> Dict[str, Acls]:
+        """
+        Returns the Acls found along the path to the given node,
+        excluding any on the node itself. The root's are always
+        included.
+        """
+        matched: Dict[str, Acls] = {}
+        if self.acls:
+            matched[""] = self.acls
+        segments = node.split(".")
+        trie: Optional[AclTrie] = self
+        for i, segment in enumerate(segments[:-1]):
+            assert trie
+            trie = trie.children.get(segment)
+            if trie is None:
+                break
+            if trie.acls:
+                matched[".".join(segments[: i + 1])] = trie.acls
+        return matched
+
+
 def _walk_diff(diff: Dict[str, Any]):
     def walk(value, path: List[str]):
         log.debug("walking diff: %s", value)
@@ -208,6 +263,16 @@ def _walk_diff(diff: Dict[str, Any]):
     return walk(diff, [])
 
 
+def _match_acls(acls: Dict[str, Acls], modified_nodes: Iterable[str]) -> SecurityCheck:
+    matched: Dict[str, Acls] = {}
+    for node in modified_nodes:
+        for key, child in acls.items():
+            if key and node.startswith(key + ".") or not key and node.startswith(key):
+                matched[key] = child
+        log.debug("security('%s'): %s", node, matched)
+    return SecurityCheck(matched)
+
+
 def generate_security_check_from_json_diff(
     original: Dict[str, Any], diff: Dict[str, Any]
 ) -> SecurityCheck:
@@ -219,11 +284,32 @@ def generate_security_check_from_json_diff(
     log.debug("security: acls=%s", acls)
     modified_nodes = _walk_diff(diff)
     log.debug("security: %s modified=%s", diff, modified_nodes)
+    return _match_acls(acls, modified_nodes.keys())
+
+
+def generate_security_check_from_changes(
+    original: Dict[str, Any], changes: Dict[str, Any]
+) -> SecurityCheck:
+    """
+    Pulls Acl objects from the original json that govern the changed
+    paths, as produced by diffing.diff_compiled.
+    """
+    acls = find_all_acls(original)
+    log.debug("security: acls=%s", acls)
+    log.debug("security: modified=%s", list(changes.keys()))
+    return _match_acls(acls, changes.keys())
+
+
+def generate_security_check_from_trie(
+    trie: AclTrie, changes: Dict[str, Any]
+) -> SecurityCheck:
+    """
+    Like generate_security_check_from_changes, only using a prebuilt
+    AclTrie so the cost is proportional to the number of changes.
+    """
     matched: Dict[str, Acls] = {}
-    for node in modified_nodes.keys():
-        for key, child in acls.items():
-            if key and node.startswith(key + ".") or not key and node.startswith(key):
-                matched[key] = child
+    for node in changes.keys():
+        matched.update(trie.matching(node))
         log.debug("security('%s'): %s", node, matched)
     return SecurityCheck(matched)
 
@@ -6,6 +6,7 @@ import transformers
 import tools
 from loggers import get_logger
 from model import *
+from model import context
 from finders import *
 from plugins.actions import PersonAction
 import scopes.users as users
@@ -61,6 +62,8 @@ class AreaObservation(Observation):
 
     @staticmethod
     async def create(area: Entity, person: Entity) -> "AreaObservation":
+        await context.get().preload([area, person])
+
         occupied = area.make(occupyable.Occupyable).occupied
 
         living: List[ObservedLiving] = flatten(
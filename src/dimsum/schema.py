@@ -123,7 +123,7 @@ async def resolve_world(obj, info):
     verify_token(info)
     domain = info.context.domain
     log.info("ariadne:world")
-    with domain.session() as session:
+    with domain.session(read_only=True) as session:
         return EntityResolver(session, await session.prepare())
 
 
@@ -153,7 +153,7 @@ async def resolve_entities(obj, info, keys, reach: int = 0, identities=True):
         serializing.Identities.PRIVATE if identities else serializing.Identities.HIDDEN
     )
     log.info("ariadne:entities keys=%s", keys)
-    with domain.session() as session:
+    with domain.session(read_only=True) as session:
         entities = flatten(
             [await materialize(session, key=key, reach=reach) for key in keys]
         )
@@ -169,7 +169,7 @@ async def resolve_entities_by_key(obj, info, key, reach: int = 0, identities=Tru
         serializing.Identities.PRIVATE if identities else serializing.Identities.HIDDEN
     )
     log.info("ariadne:entities-by-key key=%s", key)
-    with domain.session() as session:
+    with domain.session(read_only=True) as session:
         return await materialize(session, key=key, reach=reach)
 
 
@@ -181,7 +181,7 @@ async def resolve_entities_by_gid(obj, info, gid, reach: int = 0, identities=Tru
         serializing.Identities.PRIVATE if identities else serializing.Identities.HIDDEN
     )
     log.info("ariadne:entities-by-gid gid=%s", gid)
-    with domain.session() as session:
+    with domain.session(read_only=True) as session:
         return await materialize(session, gid=gid, reach=reach)
 
 
@@ -190,7 +190,7 @@ async def resolve_areas(obj, info):
     verify_token(info)
     domain = info.context.domain
     log.info("ariadne:areas")
-    with domain.session() as session:
+    with domain.session(read_only=True) as session:
         await session.prepare()
         entities = session.registrar.entities_of_klass(scopes.AreaClass)
         log.info("ariadne:areas nentities=%d", len(entities))
@@ -202,7 +202,7 @@ async def resolve_people(obj, info):
     verify_token(info)
     domain = info.context.domain
     log.info("ariadne:people")
-    with domain.session() as session:
+    with domain.session(read_only=True) as session:
         await session.prepare()
         entities = session.registrar.entities_of_klass(scopes.LivingClass)
         log.info("ariadne:people nentities=%d", len(entities))
@@ -368,7 +368,7 @@ async def resolve_language(obj, info, criteria):
     evaluator = auth_key or lqc.evaluator
     log.info("ariadne:language criteria=%s", lqc)
 
-    with domain.session() as session:
+    async def evaluate(session: domains.Session) -> Evaluation:
         log.debug("materialize world")
         w = await session.prepare()
         assert w
@@ -416,6 +416,8 @@ async def resolve_language(obj, info, criteria):
         else:
             return Evaluation(serialize_reply(reply), entities)
 
+    return await domain.command(evaluator, evaluate)
+
 
 @dataclasses.dataclass
 class Template:
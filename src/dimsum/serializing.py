@@ -10,7 +10,7 @@ import traceback
 import jsondiff
 import json
 from datetime import datetime
-from collections import ChainMap
+from collections import ChainMap, OrderedDict
 from typing import (
     Callable,
     Union,
@@ -62,15 +62,19 @@ class Identities(enum.Enum):
 
 
 class EntityProxy(wrapt.ObjectProxy):
+    """
+    Placeholder for a reference while the graph is being linked, these
+    are swapped for the entities they wrap by relink once linking is
+    done, so attribute access should never be hot. Avoid overriding
+    __getattr__ here, it's called for every miss on the proxy.
+    """
+
+    __slots__ = ("_self_ref",)
+
     def __init__(self, ref: EntityRef):
         super().__init__(ref)
         self._self_ref = ref
 
-    def __getattr__(self, *arg):
-        if self.__wrapped__ is None:
-            log.info("self.None __getattr__: %s %s", arg, self._self_ref)
-        return super().__getattr__(*arg)
-
     def __deepcopy__(self, memo):
         return copy.deepcopy(self.__wrapped__, memo)
 
@@ -83,10 +87,60 @@ class EntityProxy(wrapt.ObjectProxy):
         return str(self.__wrapped__)
 
 
+class LazyEntityProxy(EntityProxy):
+    """
+    Stub for a reference that hasn't been materialized yet. The key
+    is available without loading, anything else materializes the
+    referenced entity, synchronously, from documents that have been
+    fetched by a preload.
+    """
+
+    __slots__ = ("_self_resolver",)
+
+    def __init__(self, ref: EntityRef, resolver: Optional[Callable] = None):
+        super().__init__(ref)
+        self._self_resolver = resolver
+
+    @property
+    def resolved(self) -> bool:
+        return self._self_resolver is None
+
+    def _self_resolve(self) -> Any:
+        resolver = self._self_resolver
+        if resolver:
+            self._self_resolver = None
+            try:
+                self.__wrapped__ = resolver(self._self_ref)
+            except:
+                self._self_resolver = resolver
+                raise
+        return self.__wrapped__
+
+    def __getattr__(self, *arg):
+        if self._self_resolver and arg[0] != "key" and not arg[0].startswith("__"):
+            self._self_resolve()
+        return super().__getattr__(*arg)
+
+    def __eq__(self, other) -> bool:
+        if self._self_resolver:
+            return getattr(other, "key", None) == self._self_ref.key
+        return self.__wrapped__ == other
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash(self._self_ref.key)
+
+
 class SerializationException(Exception):
     pass
 
 
+class UnresolvedEntityException(Exception):
+    pass
+
+
 @dataclasses.dataclass(frozen=True)
 class RestoreContext:
     classes: List[Type] = dataclasses.field(default_factory=list)
@@ -363,6 +417,9 @@ def _flatten_value_entity(value: Entity, ctx: FlattenContext) -> Any:
 
 @_flatten_value.register
 def _flatten_value_entity_ref(value: EntityRef, ctx: FlattenContext) -> Any:
+    # Unresolved stubs look like EntityRefs, so avoid loading them.
+    if isinstance(value, LazyEntityProxy):
+        value = value._self_ref
     return {
         "py/object": full_class_name(EntityRef),
         "py/ref": value.pyObject,
@@ -480,6 +537,149 @@ class Materialized:
         return self.entities
 
 
+@dataclasses.dataclass
+class DocumentCache:
+    """
+    Process wide cache of parsed entity documents keyed by key and
+    version, so that unchanged documents, the world especially, are
+    only ever parsed once. Parsed documents are shared by every
+    session that loads them and so must never be mutated, deserializing
+    always builds new objects. Least recently used documents are evicted
+    once their combined size exceeds the budget.
+    """
+
+    budget: int = 32 * 1024 * 1024
+    size: int = 0
+    hits: int = 0
+    misses: int = 0
+    documents: "OrderedDict[Tuple[str, int], CompiledJson]" = dataclasses.field(
+        default_factory=OrderedDict
+    )
+
+    def compile(self, se: Serialized) -> CompiledJson:
+        if se.version is None:
+            return CompiledJson.compile(se.serialized)
+
+        key = (se.key, se.version)
+        cached = self.documents.get(key)
+        if cached and cached.text == se.serialized:
+            self.hits += 1
+            self.documents.move_to_end(key)
+            return cached
+
+        self.misses += 1
+        compiled = CompiledJson.compile(se.serialized)
+        self._add(key, compiled)
+        return compiled
+
+    def _add(self, key: Tuple[str, int], compiled: CompiledJson):
+        if len(compiled.text) > self.budget:
+            return
+        previous = self.documents.pop(key, None)
+        if previous:
+            self.size -= len(previous.text)
+        self.documents[key] = compiled
+        self.size += len(compiled.text)
+        while self.size > self.budget:
+            _, evicted = self.documents.popitem(last=False)
+            self.size -= len(evicted.text)
+
+    def clear(self):
+        self.documents.clear()
+        self.size = 0
+
+
+documents = DocumentCache()
+
+
+@dataclasses.dataclass
+class LazyReferences:
+    """
+    Tracks references that were left as stubs by a lazy materialize
+    and the documents fetched for them by preloading, which are only
+    deserialized when a stub is actually dereferenced.
+    """
+
+    registrar: Registrar
+    proxy_factory: Optional[Callable] = None
+    stubs: Dict[str, List[LazyEntityProxy]] = dataclasses.field(default_factory=dict)
+    references: Dict[str, Dict[str, bool]] = dataclasses.field(default_factory=dict)
+    documents: Dict[str, Serialized] = dataclasses.field(default_factory=dict)
+
+    def reference(self, referrer: str, ref: EntityRef) -> Any:
+        self.references.setdefault(referrer, {})[ref.key] = True
+        found = self.registrar.find_by_key(ref.key)
+        if found:
+            return found
+        stub = LazyEntityProxy(ref, self.resolve)
+        self.stubs.setdefault(ref.key, []).append(stub)
+        return stub
+
+    def link(self, entity: Entity):
+        for stub in self.stubs.pop(entity.key, []):
+            stub._self_resolver = None
+            stub.__wrapped__ = entity
+
+    def resolve(self, ref: EntityRef) -> Entity:
+        found = self.registrar.find_by_key(ref.key)
+        if found:
+            return found
+        if ref.key in self.documents:
+            return self.restore(self.documents.pop(ref.key))
+        raise UnresolvedEntityException(ref.key)
+
+    def restore(self, se: Serialized, migrate: Optional[Callable] = None) -> Entity:
+        compiled = documents.compile(se)
+        migrated, after_migration = migrate(compiled) if migrate else (False, compiled)
+        deserialized = _deserialize(
+            after_migration, functools.partial(self.reference, se.key)
+        )
+        loaded = (
+            self.proxy_factory(deserialized) if self.proxy_factory else deserialized
+        )
+        loaded.__post_init__()
+        self.registrar.register(loaded, compiled=compiled)
+        self.link(loaded)
+        loaded.validate()
+        if migrated:
+            loaded.touch()
+        return loaded
+
+    def unresolved(self, keys: Iterable[str]) -> List[str]:
+        return [key for key in keys if self.registrar.find_by_key(key) is None]
+
+    async def preload(
+        self, store: EntityStorage, entities: Iterable[Entity], hops: int = 1
+    ) -> int:
+        """
+        Materializes, in bulk, everything referenced by the given
+        entities out to the given number of hops, fetching all of the
+        missing documents for each hop with a single query.
+        """
+        restored = 0
+        frontier = [e.key for e in entities]
+        for hop in range(hops):
+            wanted = list(
+                dict.fromkeys(
+                    flatten([self.references.get(key, {}).keys() for key in frontier])
+                )
+            )
+            unresolved = self.unresolved(wanted)
+            if not unresolved:
+                break
+            missing = [key for key in unresolved if key not in self.documents]
+            if missing:
+                for se in await store.load_by_keys(missing):
+                    self.documents[se.key] = se
+            for key in unresolved:
+                if key in self.documents:
+                    self.restore(self.documents.pop(key))
+                    restored += 1
+            frontier = wanted
+        log.debug("preload: restored=%d hops=%d", restored, hops)
+        return restored
+
+
 async def materialize(
     registrar: Optional[Registrar] = None,
     store: Optional[EntityStorage] = None,
@@ -492,6 +692,7 @@ async def materialize(
     proxy_factory: Optional[Callable] = None,
     refresh: bool = False,
     migrate: Optional[Callable] = None,
+    lazy: Optional[LazyReferences] = None,
 ) -> Materialized:
     assert registrar
     assert store
@@ -546,8 +747,15 @@ async def materialize(
 
     cache.update(**{se.key: [se] for se in json})
 
-    serialized = json[0].serialized  # TODO why not all json?
-    compiled = CompiledJson.compile(serialized)
+    if lazy:
+        loaded = lazy.restore(json[0], migrate=migrate)
+        if single_entity:
+            return Materialized([loaded])
+        return Materialized(
+            [v for v in [registrar.find_by_key(se.key) for se in json] if v]
+        )
+
+    compiled = documents.compile(json[0])  # TODO why not all json?
     migrated, after_migration = migrate(compiled)
     deserialized = _deserialize(after_migration, reference)
     proxied = proxy_factory(deserialized) if proxy_factory else deserialized
@@ -589,6 +797,8 @@ async def materialize(
             )
             proxy.__wrapped__ = linked.one()
 
+    relink(loaded)
+
     loaded.validate()
 
     if migrated:
@@ -602,6 +812,45 @@ async def materialize(
     )
 
 
+def relink(entity: Entity):
+    """
+    Replaces proxies inside the entity whose references have been
+    linked with the entities themselves, so that walking the graph
+    afterwards doesn't pay for the proxy on every attribute access.
+    References that weren't followed, because of reach, are left
+    alone.
+    """
+    entity.creator = _relinked(entity.creator)
+    entity.parent = _relinked(entity.parent)
+    for scope in entity.scopes.values():
+        _relink_children(scope)
+
+
+def _relinked(value: Any) -> Any:
+    if type(value) is EntityProxy:
+        wrapped = value.__wrapped__
+        if isinstance(wrapped, Entity):
+            return wrapped
+    return value
+
+
+def _relink_children(value: Any):
+    if isinstance(value, dict):
+        for key, child in value.items():
+            relinked = _relinked(child)
+            if relinked is child:
+                _relink_children(child)
+            else:
+                value[key] = relinked
+    elif isinstance(value, list):
+        for index, child in enumerate(value):
+            relinked = _relinked(child)
+            if relinked is child:
+                _relink_children(child)
+            else:
+                value[index] = relinked
+
+
 def for_update(
     entities: Iterable[Entity], everything: bool = True, **kwargs
 ) -> Dict[str, CompiledJson]:
@@ -616,3 +865,7 @@ def for_update(
         for e in entities
         if everything or e.modified
     }
+
+
+def flatten(l):
+    return [item for sl in l for item in sl]
@@ -5,6 +5,7 @@ from .core import (
     PrioritizedStorageChain,
     AllStorageChain,
     SeparatedStorageChain,
+    VersionConflictException,
 )
 from .sqlite import SqliteStorage
 from .http import HttpStorage
@@ -14,6 +15,7 @@ __all__: List[str] = [
     "PrioritizedStorageChain",
     "AllStorageChain",
     "SeparatedStorageChain",
+    "VersionConflictException",
     "SqliteStorage",
     "HttpStorage",
 ]
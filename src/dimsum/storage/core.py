@@ -4,6 +4,10 @@ from datetime import datetime
 from model import Entity, CompiledJson, Serialized
 
 
+class VersionConflictException(Exception):
+    pass
+
+
 class EntityStorage:
     async def number_of_entities(self) -> int:
         raise NotImplementedError
@@ -17,6 +21,9 @@ class EntityStorage:
     async def load_by_key(self, key: str) -> List[Serialized]:
         raise NotImplementedError
 
+    async def load_by_keys(self, keys: List[str]) -> List[Serialized]:
+        return flatten([await self.load_by_key(key) for key in keys])
+
     async def load_all_keys(self) -> List[str]:
         raise NotImplementedError
 
@@ -130,6 +137,9 @@ class SeparatedStorageChain(EntityStorage):
     async def load_by_key(self, key: str) -> List[Serialized]:
         return await self.read.load_by_key(key)
 
+    async def load_by_keys(self, keys: List[str]) -> List[Serialized]:
+        return await self.read.load_by_keys(keys)
+
     async def load_all_keys(self) -> List[str]:
         return await self.read.load_all_keys()
 
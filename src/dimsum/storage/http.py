@@ -79,6 +79,14 @@ class HttpStorage(EntityStorage):
                 return []
             return [Serialized(**row) for row in serialized_entities]
 
+    async def load_by_keys(self, keys: List[str]):
+        async with self.session() as session:
+            query = gql(
+                "query entities($keys: [Key!]) { entities(keys: $keys, identities: true) { key serialized }}"
+            )
+            response = await session.execute(query, variable_values={"keys": keys})
+            return [Serialized(**row) for row in response["entities"]]
+
     async def close(self):
         pass
 
@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Optional, TextIO
 from loggers import get_logger
 from model import Entity, CompiledJson, Serialized
 
-from .core import EntityStorage
+from .core import EntityStorage, VersionConflictException
 
 log = get_logger("dimsum.storage")
 
@@ -99,12 +99,15 @@ class SqliteStorage(EntityStorage):
         rows = {}
         dbc = await self.db.execute(query, args)
         for row in await dbc.fetchall():
-            rows[row[0]] = row[1]
+            rows[row[0]] = row
 
         await dbc.close()
         await self.db.commit()
 
-        return [Serialized(key, serialized) for key, serialized in rows.items()]
+        return [
+            Serialized(key, serialized, version)
+            for key, serialized, version in rows.values()
+        ]
 
     async def _get_entities_to_write(
         self, gid: Optional[int] = None, key: Optional[str] = None
@@ -189,8 +192,6 @@ class SqliteStorage(EntityStorage):
                 ],
             )
             await dbc.close()
-            if dbc.rowcount != 1:
-                raise Exception("update failed")
         except:
             log.exception("UPDATE error", exc_info=True)
             log.error(
@@ -203,6 +204,15 @@ class SqliteStorage(EntityStorage):
             log.error("saved=%s", fields.saved)
             raise
 
+        if dbc.rowcount != 1:
+            log.info(
+                "conflict key=%s original=%d version=%d",
+                fields.key,
+                fields.original,
+                fields.version,
+            )
+            raise VersionConflictException("update failed")
+
     async def _insert_row(self, fields: StorageFields):
         assert self.db
         log.debug(
@@ -262,7 +272,7 @@ class SqliteStorage(EntityStorage):
 
     async def load_by_gid(self, gid: int):
         loaded = await self.load_query(
-            "SELECT key, serialized FROM entities WHERE gid = ?", [gid]
+            "SELECT key, serialized, version FROM entities WHERE gid = ?", [gid]
         )
         if len(loaded) == 1:
             return loaded
@@ -270,12 +280,24 @@ class SqliteStorage(EntityStorage):
 
     async def load_by_key(self, key: str):
         loaded = await self.load_query(
-            "SELECT key, serialized FROM entities WHERE key = ?", [key]
+            "SELECT key, serialized, version FROM entities WHERE key = ?", [key]
         )
         if len(loaded) == 1:
             return loaded
         return []
 
+    async def load_by_keys(self, keys: List[str]) -> List[Serialized]:
+        loaded: List[Serialized] = []
+        # Stay well under SQLITE_MAX_VARIABLE_NUMBER.
+        for i in range(0, len(keys), 500):
+            batch = keys[i : i + 500]
+            loaded += await self.load_query(
+                "SELECT key, serialized, version FROM entities WHERE key IN (%s)"
+                % (",".join(["?"] * len(batch)),),
+                batch,
+            )
+        return loaded
+
     async def load_all_keys(self) -> List[str]:
         await self.open_if_necessary()
         assert self.db
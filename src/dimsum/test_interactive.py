@@ -0,0 +1,29 @@
+import io
+import pytest
+
+from model import *
+from cli.interactive import Interactive
+import test
+
+
+@pytest.mark.asyncio
+async def test_interactive_keeps_player_warm():
+    tw = test.TestWorld()
+
+    channel = io.StringIO()
+    interactive = Interactive(tw.domain, username="jlewallen", channel=channel)
+    await interactive.handle("look")
+
+    assert interactive.warm.key
+    assert WorldKey in interactive.warm.keys
+    assert interactive.warm.key in interactive.warm.keys
+
+    key = interactive.warm.key
+    await interactive.handle("look")
+    await interactive.handle("inventory")
+
+    assert interactive.warm.key == key
+    assert "Welcome" in channel.getvalue()
+
+    await interactive.finished()
+    await tw.close()
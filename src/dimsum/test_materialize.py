@@ -4,7 +4,9 @@ import pytest
 import scopes
 import domains
 import library
+import serializing
 import test
+import tools
 from model import *
 
 
@@ -94,3 +96,76 @@ async def test_materialize_reach_by_area_3(caplog):
         world = await session.prepare(reach=reach)
 
     await tw.close()
+
+
+@pytest.mark.asyncio
+async def test_materialize_lazy_look(caplog):
+    tw = test.TestWorld()
+
+    with tw.domain.session() as session:
+        world = await session.prepare()
+        factory = library.example_world_factory(world)
+        await factory(session)
+        await session.save()
+
+    await tw.add_jacob()
+
+    with tw.domain.session() as session:
+        world = await session.prepare()
+        jacob = await session.materialize(key=tw.jacob_key)
+        eager = await session.execute(jacob, "look")
+        eagerly = session.registrar.number_of_entities()
+
+    with tw.domain.session(lazy=True) as session:
+        world = await session.prepare()
+        jacob = await session.materialize(key=tw.jacob_key)
+        lazy = await session.execute(jacob, "look")
+        assert session.registrar.number_of_entities() < eagerly
+        await session.save()
+
+    assert type(lazy) == type(eager)
+
+    await tw.close()
+
+
+@pytest.mark.asyncio
+async def test_materialize_relinks_proxies(caplog):
+    tw = test.TestWorld()
+
+    await tw.initialize()
+
+    with tw.domain.session() as session:
+        world = await session.prepare()
+        jacob = await session.materialize(key=tw.jacob_key)
+        area = tools.area_of(jacob)
+        assert area
+        assert not isinstance(area, serializing.EntityProxy)
+        with area.make(scopes.occupyable.Occupyable) as occupyable:
+            assert jacob in occupyable.occupied
+            assert [
+                e for e in occupyable.occupied if type(e) is serializing.EntityProxy
+            ] == []
+
+    await tw.close()
+
+
+@pytest.mark.asyncio
+async def test_materialize_reuses_parsed_documents(caplog):
+    tw = test.TestWorld()
+
+    await tw.initialize()
+
+    with tw.domain.session() as session:
+        world = await session.prepare()
+        await session.materialize(key=tw.jacob_key)
+
+    hits = serializing.documents.hits
+
+    with tw.domain.session() as session:
+        world = await session.prepare()
+        jacob = await session.materialize(key=tw.jacob_key)
+        assert serializing.documents.hits > hits
+        await session.execute(jacob, "look")
+        await session.save()
+
+    await tw.close()
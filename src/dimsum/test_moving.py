@@ -1,4 +1,5 @@
-from typing import Optional
+import asyncio
+from typing import List, Optional, Tuple
 import pytest
 
 from model import *
@@ -319,3 +320,70 @@ async def test_go_adjacent_unavailable():
     await tw.failure("go door")
 
     await tw.close()
+
+
+async def _execute_in_area(tw: test.TestWorld, command: str, trace=None):
+    async def evaluate(session):
+        await session.prepare()
+        jacob = await session.materialize(key=tw.jacob_key)
+        if trace is not None:
+            trace.append(("begin", command))
+            await asyncio.sleep(0.01)
+        reply = await session.execute(jacob, command)
+        await session.save()
+        if trace is not None:
+            trace.append(("end", command))
+        return reply
+
+    assert tw.jacob_key
+    return await tw.domain.command(tw.jacob_key, evaluate)
+
+
+@pytest.mark.asyncio
+async def test_commands_in_same_area_are_serialized():
+    tw = test.TestWorld()
+    await tw.initialize()
+
+    assert not isinstance(await _execute_in_area(tw, "look"), Failure)
+
+    trace: List[Tuple[str, str]] = []
+    await asyncio.gather(
+        _execute_in_area(tw, "make Hammer", trace),
+        _execute_in_area(tw, "make Box", trace),
+    )
+
+    assert [e for e, _ in trace] == ["begin", "end", "begin", "end"]
+    assert tw.domain.conflicts == 0
+    assert tw.domain.areas.locks == {}
+
+    await tw.close()
+
+
+@pytest.mark.asyncio
+async def test_moving_takes_both_areas():
+    tw = test.TestWorld()
+    await tw.initialize()
+
+    await tw.success("dig north|south to 'Kitchen'")
+
+    assert tw.jacob_key
+    with tw.domain.session() as session:
+        await session.prepare()
+        jacob = await session.materialize(key=tw.jacob_key)
+        before = await find_entity_area(jacob)
+
+    assert not isinstance(await _execute_in_area(tw, "look"), Failure)
+    assert tw.domain.areas.guess(tw.jacob_key) == [before.key]
+
+    assert not isinstance(await _execute_in_area(tw, "go north"), Failure)
+
+    with tw.domain.session() as session:
+        await session.prepare()
+        jacob = await session.materialize(key=tw.jacob_key)
+        after = await find_entity_area(jacob)
+
+    assert after.key != before.key
+    assert tw.domain.areas.guess(tw.jacob_key) == [after.key]
+    assert tw.domain.areas.locks == {}
+
+    await tw.close()
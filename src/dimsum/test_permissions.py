@@ -106,6 +106,76 @@ async def test_permissions_wild_json_idea_5():
     assert acl_names(check.acls) == ["", "collection.1.example"]
 
 
+@pytest.mark.asyncio
+async def test_permissions_structural_diff_nested():
+    tree = ExampleTree()
+    before = serializing.serialize(tree, indent=True)
+    tree.left.example.value = "Modified"
+    after = serializing.serialize(tree, indent=True)
+    assert before and after
+    changes = diff_compiled(json.loads(before), json.loads(after))
+    assert list(changes.keys()) == ["left.example.value"]
+    check = generate_security_check_from_changes(json.loads(before), changes)
+    assert acl_names(check.acls) == ["", "left.example"]
+
+
+@pytest.mark.asyncio
+async def test_permissions_structural_diff_appended():
+    tree = ExampleTree()
+    before = serializing.serialize(tree, indent=True)
+    tree.collection.append(InnerObject())
+    after = serializing.serialize(tree, indent=True)
+    assert before and after
+    changes = diff_compiled(json.loads(before), json.loads(after))
+    assert list(changes.keys()) == ["collection"]
+    check = generate_security_check_from_changes(json.loads(before), changes)
+    assert acl_names(check.acls) == [""]
+
+
+@pytest.mark.asyncio
+async def test_permissions_structural_diff_collection():
+    tree = ExampleTree()
+    tree.collection.append(InnerObject())
+    tree.collection.append(InnerObject())
+    tree.collection.append(InnerObject())
+    before = serializing.serialize(tree, indent=True)
+    tree.collection[1].example.value = "Modified"
+    after = serializing.serialize(tree, indent=True)
+    assert before and after
+    changes = diff_compiled(json.loads(before), json.loads(after))
+    assert list(changes.keys()) == ["collection.1.example.value"]
+    check = generate_security_check_from_changes(json.loads(before), changes)
+    assert acl_names(check.acls) == ["", "collection.1.example"]
+
+
+@pytest.mark.asyncio
+async def test_permissions_structural_diff_identical():
+    tree = ExampleTree()
+    before = serializing.serialize(tree, indent=True)
+    assert before
+    assert diff_compiled(json.loads(before), json.loads(before)) == {}
+
+
+@pytest.mark.asyncio
+async def test_permissions_acl_trie():
+    tree = ExampleTree()
+    tree.collection.append(InnerObject())
+    tree.collection.append(InnerObject())
+    before = serializing.serialize(tree, indent=True)
+    tree.collection[1].example.value = "Modified"
+    tree.left.value = "Modified"
+    after = serializing.serialize(tree, indent=True)
+    assert before and after
+    changes = diff_compiled(json.loads(before), json.loads(after))
+    trie = AclTrie.build(json.loads(before))
+    check = generate_security_check_from_trie(trie, changes)
+    assert acl_names(check.acls) == ["", "collection.1.example"]
+    assert (
+        check.acls
+        == generate_security_check_from_changes(json.loads(before), changes).acls
+    )
+
+
 @pytest.mark.asyncio
 async def test_permissions_basics():
     tw = test.TestWorld()
@@ -4,6 +4,7 @@ import sqlite3
 import pytest
 
 import domains
+from domains.session import ReadOnlySessionException
 import scopes
 import serializing
 import storage
@@ -153,3 +154,63 @@ async def test_storage_multiple_saves(caplog):
         await session.save()
 
     await store.close()
+
+
+@pytest.mark.asyncio
+async def test_storage_retries_version_conflicts():
+    store = storage.SqliteStorage(":memory:")
+    domain = domains.Domain(store=store)
+
+    with domain.session() as session:
+        await session.prepare()
+        await session.save()
+
+    attempts = 0
+
+    async def rename(session: domains.Session):
+        nonlocal attempts
+        attempts += 1
+        world = await session.prepare()
+        if attempts == 1:
+            with domain.session() as other:
+                concurrent = await other.prepare()
+                concurrent.props.name = "Concurrent"
+                concurrent.touch()
+                await other.save()
+        world.props.name = "Renamed"
+        world.touch()
+        await session.save()
+        return world.props.name
+
+    assert await domain.retrying(rename) == "Renamed"
+    assert attempts == 2
+    assert domain.conflicts == 1
+    assert domain.retries == 1
+
+    with domain.session() as session:
+        world = await session.prepare()
+        assert world.props.name == "Renamed"
+
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_storage_read_only_session():
+    store = storage.SqliteStorage(":memory:")
+    domain = domains.Domain(store=store)
+
+    with domain.session() as session:
+        world = await session.prepare()
+        await session.add_area(scopes.area(creator=world, props=Common("Area")))
+        await session.save()
+
+    with domain.session(read_only=True) as session:
+        world = await session.prepare()
+        assert session.registrar.number_of_entities() == 2
+        assert session.registrar.get_original_if_available(WorldKey) is None
+
+        world.touch()
+        with pytest.raises(ReadOnlySessionException):
+            await session.save()
+
+    await store.close()
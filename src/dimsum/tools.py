@@ -77,6 +77,20 @@ def get_contributing_entities(world: Entity, player: Entity) -> EntitySet:
     return entities
 
 
+async def preload_contributing_entities(
+    ctx: MaterializeAndCreate, world: Entity, player: Entity
+):
+    """
+    Preloads everything get_contributing_entities will touch, and the
+    references those entities hold, in as few bulk loads as possible.
+    """
+    await ctx.preload([player])
+    area = area_of(player)
+    if area:
+        await ctx.preload([area])
+    await ctx.preload(get_contributing_entities(world, player).all())
+
+
 def get_holding(entity: Entity) -> List[Entity]:
     with entity.make_and_discard(carryable.Containing) as container:
         return container.holding